@@ -160,12 +160,13 @@ class TestFileMixin:
                 try:
                     st = os.stat(file) if follow_symlinks else os.lstat(file)
                 except OSError:
-                    st = None
-                try:
-                    with open(file, 'rb') as fh:
-                        bytes_ = fh.read()
-                except Exception:
-                    bytes_ = None
+                    st = bytes_ = None
+                else:
+                    try:
+                        with open(file, 'rb') as fh:
+                            bytes_ = fh.read()
+                    except Exception:
+                        bytes_ = None
                 return {'stat': st, 'bytes': bytes_}
             else:
                 with util.fs.open_archive_path(cpath) as zh:
@@ -204,7 +205,7 @@ class TestFileMixin:
         )
 
         try:
-            for i in {*stat1, *stat2}:
+            for i in {**stat1, **stat2}:
                 msg = f'{i} not equal'
                 v1, v2 = stat1.get(i), stat2.get(i)
                 if i == 'mtime':
@@ -225,80 +226,53 @@ class TestFileMixin:
                 raise self.failureException(msg) from None
 
     def _assert_file_equal_get_common_stats(self, data1, data2):
-        # Such bits may be changed by the API when copying among ZIP files,
-        # and we don't really care about them.
-        excluded_flag_bits = 1 << 3
-
         st1 = data1.get('stat')
         st2 = data2.get('stat')
 
-        if isinstance(st1, os.stat_result):
-            if isinstance(st2, os.stat_result):
-                stat1 = {
-                    'mode': st1.st_mode,
-                    'uid': st1.st_uid,
-                    'gid': st1.st_gid,
-                    'mtime': st1.st_mtime,
-                }
-            else:
-                stat1 = {
-                    'mtime': st1.st_mtime,
-                }
-
-        elif isinstance(st1, zipfile.ZipInfo):
-            if isinstance(st2, zipfile.ZipInfo):
-                stat1 = {
-                    'mtime': zip_timestamp(st1),
-                    'compress_type': st1.compress_type,
-                    'comment': st1.comment,
-                    'extra': st1.extra,
-                    'flag_bits': st1.flag_bits & ~excluded_flag_bits,
-                    'internal_attr': st1.internal_attr,
-                    'external_attr': st1.external_attr,
-                }
-            else:
-                stat1 = {
-                    'mtime': zip_timestamp(st1),
-                }
-        else:
-            stat1 = {}
-
-        if isinstance(st2, os.stat_result):
-            if isinstance(st1, os.stat_result):
-                stat2 = {
-                    'mode': st2.st_mode,
-                    'uid': st2.st_uid,
-                    'gid': st2.st_gid,
-                    'mtime': st2.st_mtime,
-                }
-            else:
-                stat2 = {
-                    'mtime': st2.st_mtime,
-                }
-
-        elif isinstance(st2, zipfile.ZipInfo):
-            if isinstance(st1, zipfile.ZipInfo):
-                stat2 = {
-                    'mtime': zip_timestamp(st2),
-                    'compress_type': st2.compress_type,
-                    'comment': st2.comment,
-                    'extra': st2.extra,
-                    'flag_bits': st2.flag_bits & ~excluded_flag_bits,
-                    'internal_attr': st2.internal_attr,
-                    'external_attr': st2.external_attr,
-                }
-            else:
-                stat2 = {
-                    'mtime': zip_timestamp(st2),
-                }
-        else:
-            stat2 = {}
+        stat1 = self._assert_file_equal_get_stat(st1, st2)
+        stat2 = self._assert_file_equal_get_stat(st2, st1)
 
         stat1['bytes'] = data1.get('bytes')
         stat2['bytes'] = data2.get('bytes')
 
         return stat1, stat2
 
+    @staticmethod
+    def _assert_file_equal_get_stat(st, st_other):
+        """Get comparable stats of st with regard to the type of st_other."""
+        # Such bits may be changed by the API when copying among ZIP files,
+        # and we don't really care about them.
+        excluded_flag_bits = 1 << 3
+
+        if isinstance(st, os.stat_result):
+            if isinstance(st_other, os.stat_result):
+                return {
+                    'mode': st.st_mode,
+                    'uid': st.st_uid,
+                    'gid': st.st_gid,
+                    'mtime': st.st_mtime,
+                }
+            return {
+                'mtime': st.st_mtime,
+            }
+
+        if isinstance(st, zipfile.ZipInfo):
+            if isinstance(st_other, zipfile.ZipInfo):
+                return {
+                    'mtime': zip_timestamp(st),
+                    'compress_type': st.compress_type,
+                    'comment': st.comment,
+                    'extra': st.extra,
+                    'flag_bits': st.flag_bits & ~excluded_flag_bits,
+                    'internal_attr': st.internal_attr,
+                    'external_attr': st.external_attr,
+                }
+            return {
+                'mtime': zip_timestamp(st),
+            }
+
+        return {}
+
 
 class TestBookMixin:
     """A mixin class for unittest.TestCase to support book testing utilities"""
@@ -14,6 +14,9 @@ from webscrapbook.scrapbook.convert.wsb2sb import NC, NS1, RDF
 
 from . import TEMP_DIR, TestBookMixin, glob_files
 
+# legacy ScrapBook ID mapped from the commonly used item ID '20200101000000000'
+OID_20200101 = util.datetime_to_id_legacy(util.id_to_datetime('20200101000000000'))
+
 
 def setUpModule():
     # set up a temp directory for testing
@@ -92,7 +95,7 @@ class TestRun(Test):
         with open(self.test_output_rdf, 'rb') as fh:
             tree = etree.parse(fh)
 
-        oid = util.datetime_to_id_legacy(util.id_to_datetime('20200101000000000'))
+        oid = OID_20200101
         self.assertEqual(tree.getroot().tag, f'{RDF}RDF')
         self.assertEqual(dict(tree.find(f'{RDF}Description').attrib), {
             f'{RDF}about': f'urn:scrapbook:item{oid}',
@@ -125,7 +128,7 @@ class TestRun(Test):
         with open(self.test_output_rdf, 'rb') as fh:
             tree = etree.parse(fh)
 
-        oid = util.datetime_to_id_legacy(util.id_to_datetime('20200101000000000'))
+        oid = OID_20200101
         self.assertEqual(dict(tree.find(f'{NC}BookmarkSeparator').attrib), {
             f'{RDF}about': f'urn:scrapbook:item{oid}',
             f'{NS1}id': oid,
@@ -169,7 +172,7 @@ postit page content < & > &lt; &amp; &gt;
         self.assertEqual(tree.find(f'{RDF}Description').attrib[f'{NS1}type'], 'note')
 
         # check output legacy note format
-        oid = util.datetime_to_id_legacy(util.id_to_datetime('20200101000000000'))
+        oid = OID_20200101
         with open(os.path.join(self.test_output, 'data', oid, 'index.html'), encoding='UTF-8') as fh:
             self.assertEqual(fh.read(), """\
 <html><head><meta http-equiv="Content-Type" content="text/html;Charset=UTF-8"></head><body><pre>
@@ -422,7 +425,7 @@ postit page content < & > &lt; &amp; &gt;
         with open(self.test_output_rdf, 'rb') as fh:
             tree = etree.parse(fh)
 
-        ts = util.datetime_to_id_legacy(util.id_to_datetime('20200101000000000'))
+        ts = OID_20200101
         self.assertEqual(
             tree.find(f'{RDF}Description').attrib[f'{NS1}icon'],
             f'resource://scrapbook/data/{ts}/favicon.bmp',
@@ -750,14 +753,14 @@ tree_dir = tree
         for _info in wsb2sb.run(self.test_input, self.test_output):
             pass
 
-        oid = util.datetime_to_id_legacy(util.id_to_datetime('20200101000000000'))
+        data_dir = os.path.join(self.test_output, 'data', OID_20200101)
         self.assertEqual(glob_files(self.test_output), {
             os.path.join(self.test_output, ''),
             os.path.join(self.test_output, 'scrapbook.rdf'),
             os.path.join(self.test_output, 'data'),
-            os.path.join(self.test_output, 'data', oid),
-            os.path.join(self.test_output, 'data', oid, 'index.html'),
-            os.path.join(self.test_output, 'data', oid, 'page.html'),
+            data_dir,
+            os.path.join(data_dir, 'index.html'),
+            os.path.join(data_dir, 'page.html'),
         })
 
     def test_copy_data_files02(self):
@@ -777,13 +780,13 @@ tree_dir = tree
         for _info in wsb2sb.run(self.test_input, self.test_output):
             pass
 
-        oid = util.datetime_to_id_legacy(util.id_to_datetime('20200101000000000'))
+        data_dir = os.path.join(self.test_output, 'data', OID_20200101)
         self.assertEqual(glob_files(self.test_output), {
             os.path.join(self.test_output, ''),
             os.path.join(self.test_output, 'scrapbook.rdf'),
             os.path.join(self.test_output, 'data'),
-            os.path.join(self.test_output, 'data', oid),
-            os.path.join(self.test_output, 'data', oid, 'index.html'),
+            data_dir,
+            os.path.join(data_dir, 'index.html'),
         })
 
     def test_copy_data_files03(self):
@@ -803,16 +806,16 @@ tree_dir = tree
         for _info in wsb2sb.run(self.test_input, self.test_output):
             pass
 
-        oid = util.datetime_to_id_legacy(util.id_to_datetime('20200101000000000'))
+        data_dir = os.path.join(self.test_output, 'data', OID_20200101)
         self.assertEqual(glob_files(self.test_output), {
             os.path.join(self.test_output, ''),
             os.path.join(self.test_output, 'scrapbook.rdf'),
             os.path.join(self.test_output, 'data'),
-            os.path.join(self.test_output, 'data', oid),
-            os.path.join(self.test_output, 'data', oid, 'index.html'),
-            os.path.join(self.test_output, 'data', oid, 'page.html'),
-            os.path.join(self.test_output, 'data', oid, 'subdir'),
-            os.path.join(self.test_output, 'data', oid, 'subdir', 'page2.html'),
+            data_dir,
+            os.path.join(data_dir, 'index.html'),
+            os.path.join(data_dir, 'page.html'),
+            os.path.join(data_dir, 'subdir'),
+            os.path.join(data_dir, 'subdir', 'page2.html'),
         })
 
     def test_copy_data_files04(self):
@@ -833,16 +836,16 @@ tree_dir = tree
         for _info in wsb2sb.run(self.test_input, self.test_output):
             pass
 
-        oid = util.datetime_to_id_legacy(util.id_to_datetime('20200101000000000'))
+        data_dir = os.path.join(self.test_output, 'data', OID_20200101)
         self.assertEqual(glob_files(self.test_output), {
             os.path.join(self.test_output, ''),
             os.path.join(self.test_output, 'scrapbook.rdf'),
             os.path.join(self.test_output, 'data'),
-            os.path.join(self.test_output, 'data', oid),
-            os.path.join(self.test_output, 'data', oid, 'index.html'),
-            os.path.join(self.test_output, 'data', oid, 'page.html'),
-            os.path.join(self.test_output, 'data', oid, 'subdir'),
-            os.path.join(self.test_output, 'data', oid, 'subdir', 'page2.html'),
+            data_dir,
+            os.path.join(data_dir, 'index.html'),
+            os.path.join(data_dir, 'page.html'),
+            os.path.join(data_dir, 'subdir'),
+            os.path.join(data_dir, 'subdir', 'page2.html'),
         })
 
     def test_copy_data_files05(self):
@@ -890,24 +893,28 @@ some content
         for _info in wsb2sb.run(self.test_input, self.test_output):
             pass
 
-        oid = util.datetime_to_id_legacy(util.id_to_datetime('20200101000000000'))
+        data_dir = os.path.join(self.test_output, 'data', OID_20200101)
         self.assertEqual(glob_files(self.test_output), {
             os.path.join(self.test_output, ''),
             os.path.join(self.test_output, 'scrapbook.rdf'),
             os.path.join(self.test_output, 'data'),
-            os.path.join(self.test_output, 'data', oid),
-            os.path.join(self.test_output, 'data', oid, 'index.html'),
-            os.path.join(self.test_output, 'data', oid, '中文#1.xhtml'),
+            data_dir,
+            os.path.join(data_dir, 'index.html'),
+            os.path.join(data_dir, '中文#1.xhtml'),
         })
         self.assertEqual(
-            util.get_meta_refreshed_file(os.path.join(self.test_output, 'data', oid, 'index.html')),
-            os.path.join(self.test_output, 'data', oid, '中文#1.xhtml'),
+            util.get_meta_refreshed_file(os.path.join(data_dir, 'index.html')),
+            os.path.join(data_dir, '中文#1.xhtml'),
         )
 
 
 class TestConvertHtmlFile(Test):
-    def test_convert_html_file_linemarker01(self):
-        """Convert linemarker."""
+    def convert_index_file(self, input):
+        """Convert a book with a single item whose index file is the input.
+
+        Returns:
+            str: content of the converted index file
+        """
         self.init_book(self.test_input, meta={
             '20200101000000000': {
                 'index': '20200101000000000/index.html',
@@ -915,10 +922,6 @@ class TestConvertHtmlFile(Test):
             },
         })
 
-        input = """<html><body><scrapbook-linemarker data-scrapbook-id="20200101000000000" data-scrapbook-elem="linemarker" style="background: #FFFF00; background: linear-gradient(transparent 40%, rgba(255,255,0,0.9) 90%, transparent 100%);" class="first">Lorem ipsum dolor </scrapbook-linemarker><strong><scrapbook-linemarker data-scrapbook-id="20200101000000000" data-scrapbook-elem="linemarker" style="background: #FFFF00; background: linear-gradient(transparent 40%, rgba(255,255,0,0.9) 90%, transparent 100%);">sit amet</scrapbook-linemarker></strong><scrapbook-linemarker data-scrapbook-id="20200101000000000" data-scrapbook-elem="linemarker" style="background: #FFFF00; background: linear-gradient(transparent 40%, rgba(255,255,0,0.9) 90%, transparent 100%);" class="last">, consectetur adipiscing elit.</scrapbook-linemarker></body></html>"""  # noqa: E501
-
-        expected = """<html><body><span data-sb-id="20200101000000000" data-sb-obj="linemarker" class="linemarker-marked-line" style="background: #FFFF00; background: linear-gradient(transparent 40%, rgba(255,255,0,0.9) 90%, transparent 100%);">Lorem ipsum dolor </span><strong><span data-sb-id="20200101000000000" data-sb-obj="linemarker" class="linemarker-marked-line" style="background: #FFFF00; background: linear-gradient(transparent 40%, rgba(255,255,0,0.9) 90%, transparent 100%);">sit amet</span></strong><span data-sb-id="20200101000000000" data-sb-obj="linemarker" class="linemarker-marked-line" style="background: #FFFF00; background: linear-gradient(transparent 40%, rgba(255,255,0,0.9) 90%, transparent 100%);">, consectetur adipiscing elit.</span></body></html>"""  # noqa: E501
-
         index_dir = os.path.join(self.test_input, '20200101000000000')
         os.makedirs(index_dir, exist_ok=True)
         with open(os.path.join(index_dir, 'index.html'), 'w', encoding='UTF-8') as fh:
@@ -927,19 +930,19 @@ class TestConvertHtmlFile(Test):
         for _info in wsb2sb.run(self.test_input, self.test_output):
             pass
 
-        oid = util.datetime_to_id_legacy(util.id_to_datetime('20200101000000000'))
-        with open(os.path.join(self.test_output, 'data', oid, 'index.html'), encoding='UTF-8') as fh:
-            self.assertEqual(fh.read(), expected)
+        with open(os.path.join(self.test_output, 'data', OID_20200101, 'index.html'), encoding='UTF-8') as fh:
+            return fh.read()
+
+    def test_convert_html_file_linemarker01(self):
+        """Convert linemarker."""
+        input = """<html><body><scrapbook-linemarker data-scrapbook-id="20200101000000000" data-scrapbook-elem="linemarker" style="background: #FFFF00; background: linear-gradient(transparent 40%, rgba(255,255,0,0.9) 90%, transparent 100%);" class="first">Lorem ipsum dolor </scrapbook-linemarker><strong><scrapbook-linemarker data-scrapbook-id="20200101000000000" data-scrapbook-elem="linemarker" style="background: #FFFF00; background: linear-gradient(transparent 40%, rgba(255,255,0,0.9) 90%, transparent 100%);">sit amet</scrapbook-linemarker></strong><scrapbook-linemarker data-scrapbook-id="20200101000000000" data-scrapbook-elem="linemarker" style="background: #FFFF00; background: linear-gradient(transparent 40%, rgba(255,255,0,0.9) 90%, transparent 100%);" class="last">, consectetur adipiscing elit.</scrapbook-linemarker></body></html>"""  # noqa: E501
+
+        expected = """<html><body><span data-sb-id="20200101000000000" data-sb-obj="linemarker" class="linemarker-marked-line" style="background: #FFFF00; background: linear-gradient(transparent 40%, rgba(255,255,0,0.9) 90%, transparent 100%);">Lorem ipsum dolor </span><strong><span data-sb-id="20200101000000000" data-sb-obj="linemarker" class="linemarker-marked-line" style="background: #FFFF00; background: linear-gradient(transparent 40%, rgba(255,255,0,0.9) 90%, transparent 100%);">sit amet</span></strong><span data-sb-id="20200101000000000" data-sb-obj="linemarker" class="linemarker-marked-line" style="background: #FFFF00; background: linear-gradient(transparent 40%, rgba(255,255,0,0.9) 90%, transparent 100%);">, consectetur adipiscing elit.</span></body></html>"""  # noqa: E501
+
+        self.assertEqual(self.convert_index_file(input), expected)
 
     def test_convert_html_file_linemarker02(self):
         """Convert annotated linemarker."""
-        self.init_book(self.test_input, meta={
-            '20200101000000000': {
-                'index': '20200101000000000/index.html',
-                'type': '',
-            },
-        })
-
         input = """<html><body><b><scrapbook-linemarker data-scrapbook-id="20200101000000000" data-scrapbook-elem="linemarker" style="border-bottom: 2px dotted #FF0000;" class="first" title="inline annotation
 2nd line">Suspendisse eget</scrapbook-linemarker></b><scrapbook-linemarker data-scrapbook-id="20200101000000000" data-scrapbook-elem="linemarker" style="border-bottom: 2px dotted #FF0000;" class="last" title="inline annotation
 2nd line"> interdum quam, eu semper ipsum</scrapbook-linemarker>.<style data-scrapbook-elem="annotation-css">/* stylesheet */</style><script data-scrapbook-elem="annotation-loader">/* script */</script></body></html>"""  # noqa: E501
@@ -948,156 +951,54 @@ class TestConvertHtmlFile(Test):
 2nd line">Suspendisse eget</span></b><span data-sb-id="20200101000000000" data-sb-obj="inline" class="scrapbook-inline" style="border-bottom: 2px dotted #FF0000;" title="inline annotation
 2nd line"> interdum quam, eu semper ipsum</span>.</body></html>"""  # noqa: E501
 
-        index_dir = os.path.join(self.test_input, '20200101000000000')
-        os.makedirs(index_dir, exist_ok=True)
-        with open(os.path.join(index_dir, 'index.html'), 'w', encoding='UTF-8') as fh:
-            fh.write(input)
-
-        for _info in wsb2sb.run(self.test_input, self.test_output):
-            pass
-
-        oid = util.datetime_to_id_legacy(util.id_to_datetime('20200101000000000'))
-        with open(os.path.join(self.test_output, 'data', oid, 'index.html'), encoding='UTF-8') as fh:
-            self.assertEqual(fh.read(), expected)
+        self.assertEqual(self.convert_index_file(input), expected)
 
     def test_convert_html_file_sticky01(self):
         """Convert sticky (styled plaintext)."""
-        self.init_book(self.test_input, meta={
-            '20200101000000000': {
-                'index': '20200101000000000/index.html',
-                'type': '',
-            },
-        })
-
         input = """<html><body><scrapbook-sticky data-scrapbook-id="20200101000000000" data-scrapbook-elem="sticky" class="styled plaintext" style="width: 250px; height: 100px; left: 572px; top: 83px;">annotation
 2nd line</scrapbook-sticky><style data-scrapbook-elem="annotation-css">/* stylesheet */</style><script data-scrapbook-elem="annotation-loader">/* script */</script></body></html>"""  # noqa: E501
 
         expected = """<html><body><div data-sb-obj="freenote" style="cursor: help; overflow: visible; border: 1px solid #CCCCCC; border-top-width: 12px; background: #FAFFFA; opacity: 0.95; padding: 0px; z-index: 500000; text-align: start; font-size: small; line-height: 1.2em; word-wrap: break-word; position: absolute; width: 250px; height: 100px; left: 572px; top: 83px;">annotation<br>2nd line</div></body></html>"""  # noqa: E501
 
-        index_dir = os.path.join(self.test_input, '20200101000000000')
-        os.makedirs(index_dir, exist_ok=True)
-        with open(os.path.join(index_dir, 'index.html'), 'w', encoding='UTF-8') as fh:
-            fh.write(input)
-
-        for _info in wsb2sb.run(self.test_input, self.test_output):
-            pass
-
-        oid = util.datetime_to_id_legacy(util.id_to_datetime('20200101000000000'))
-        with open(os.path.join(self.test_output, 'data', oid, 'index.html'), encoding='UTF-8') as fh:
-            self.assertEqual(fh.read(), expected)
+        self.assertEqual(self.convert_index_file(input), expected)
 
     def test_convert_html_file_sticky02(self):
         """Convert sticky (styled plaintext relative)."""
-        self.init_book(self.test_input, meta={
-            '20200101000000000': {
-                'index': '20200101000000000/index.html',
-                'type': '',
-            },
-        })
-
         input = """<html><body><scrapbook-sticky data-scrapbook-id="20200101000000000" data-scrapbook-elem="sticky" class="styled plaintext relative">annotation
 2nd line</scrapbook-sticky><style data-scrapbook-elem="annotation-css">/* stylesheet */</style><script data-scrapbook-elem="annotation-loader">/* script */</script></body></html>"""  # noqa: E501
 
         expected = """<html><body><div data-sb-obj="freenote" style="cursor: help; overflow: visible; margin: 16px auto; border: 1px solid #CCCCCC; border-top-width: 12px; background: #FAFFFA; opacity: 0.95; padding: 0px; z-index: 500000; text-align: start; font-size: small; line-height: 1.2em; word-wrap: break-word; position: static;">annotation<br>2nd line</div></body></html>"""  # noqa: E501
 
-        index_dir = os.path.join(self.test_input, '20200101000000000')
-        os.makedirs(index_dir, exist_ok=True)
-        with open(os.path.join(index_dir, 'index.html'), 'w', encoding='UTF-8') as fh:
-            fh.write(input)
-
-        for _info in wsb2sb.run(self.test_input, self.test_output):
-            pass
-
-        oid = util.datetime_to_id_legacy(util.id_to_datetime('20200101000000000'))
-        with open(os.path.join(self.test_output, 'data', oid, 'index.html'), encoding='UTF-8') as fh:
-            self.assertEqual(fh.read(), expected)
+        self.assertEqual(self.convert_index_file(input), expected)
 
     def test_convert_html_file_sticky03(self):
         """Convert sticky (styled)."""
-        self.init_book(self.test_input, meta={
-            '20200101000000000': {
-                'index': '20200101000000000/index.html',
-                'type': '',
-            },
-        })
-
         input = """<html><body><scrapbook-sticky data-scrapbook-id="20200101000000000" data-scrapbook-elem="sticky" class="styled" style="left: 367px; top: 323px; width: 250px; height: 100px;">annotation<div><b>2nd</b> line</div></scrapbook-sticky><style data-scrapbook-elem="annotation-css">/* stylesheet */</style><script data-scrapbook-elem="annotation-loader">/* script */</script></body></html>"""  # noqa: E501
 
         expected = """<html><body><div data-sb-obj="freenote" style="cursor: help; overflow: visible; border: 1px solid #CCCCCC; border-top-width: 12px; background: #FAFFFA; opacity: 0.95; padding: 0px; z-index: 500000; text-align: start; font-size: small; line-height: 1.2em; word-wrap: break-word; position: absolute; left: 367px; top: 323px; width: 250px; height: 100px;">annotation<div><b>2nd</b> line</div></div></body></html>"""  # noqa: E501
 
-        index_dir = os.path.join(self.test_input, '20200101000000000')
-        os.makedirs(index_dir, exist_ok=True)
-        with open(os.path.join(index_dir, 'index.html'), 'w', encoding='UTF-8') as fh:
-            fh.write(input)
-
-        for _info in wsb2sb.run(self.test_input, self.test_output):
-            pass
-
-        oid = util.datetime_to_id_legacy(util.id_to_datetime('20200101000000000'))
-        with open(os.path.join(self.test_output, 'data', oid, 'index.html'), encoding='UTF-8') as fh:
-            self.assertEqual(fh.read(), expected)
+        self.assertEqual(self.convert_index_file(input), expected)
 
     def test_convert_html_file_sticky04(self):
         """Convert sticky (styled relative)."""
-        self.init_book(self.test_input, meta={
-            '20200101000000000': {
-                'index': '20200101000000000/index.html',
-                'type': '',
-            },
-        })
-
         input = """<html><body><scrapbook-sticky data-scrapbook-id="20200101000000000" data-scrapbook-elem="sticky" class="styled relative" style="height: 42.6px;">annotation<div><b>2nd</b> line</div></scrapbook-sticky><style data-scrapbook-elem="annotation-css">/* stylesheet */</style><script data-scrapbook-elem="annotation-loader">/* script */</script></body></html>"""  # noqa: E501
 
         expected = """<html><body><div data-sb-obj="freenote" style="cursor: help; overflow: visible; margin: 16px auto; border: 1px solid #CCCCCC; border-top-width: 12px; background: #FAFFFA; opacity: 0.95; padding: 0px; z-index: 500000; text-align: start; font-size: small; line-height: 1.2em; word-wrap: break-word; position: static; height: 42.6px;">annotation<div><b>2nd</b> line</div></div></body></html>"""  # noqa: E501
 
-        index_dir = os.path.join(self.test_input, '20200101000000000')
-        os.makedirs(index_dir, exist_ok=True)
-        with open(os.path.join(index_dir, 'index.html'), 'w', encoding='UTF-8') as fh:
-            fh.write(input)
-
-        for _info in wsb2sb.run(self.test_input, self.test_output):
-            pass
-
-        oid = util.datetime_to_id_legacy(util.id_to_datetime('20200101000000000'))
-        with open(os.path.join(self.test_output, 'data', oid, 'index.html'), encoding='UTF-8') as fh:
-            self.assertEqual(fh.read(), expected)
+        self.assertEqual(self.convert_index_file(input), expected)
 
     def test_convert_html_file_sticky05(self):
         """Convert sticky (plaintext relative)."""
-        self.init_book(self.test_input, meta={
-            '20200101000000000': {
-                'index': '20200101000000000/index.html',
-                'type': '',
-            },
-        })
-
         input = """<html><body><scrapbook-sticky data-scrapbook-elem="sticky" class="plaintext relative" style="border: 1px dotted rgb(215, 221, 191) !important; margin: 10px !important; padding: 10px !important; font-size: 12px !important; font-weight: normal !important; line-height: 16px !important; text-decoration: none !important; color: rgb(96, 96, 96) !important; background-color: rgb(239, 248, 206) !important; cursor: pointer !important; white-space: pre-wrap;">Legacy block comment.
 Second line.</scrapbook-sticky><style data-scrapbook-elem="annotation-css">/* stylesheet */</style><script data-scrapbook-elem="annotation-loader">/* script */</script></body></html>"""  # noqa: E501
 
         expected = """<html><body><div class="scrapbook-block-comment" style="border: 1px dotted rgb(215, 221, 191) !important; margin: 10px !important; padding: 10px !important; font-size: 12px !important; font-weight: normal !important; line-height: 16px !important; text-decoration: none !important; color: rgb(96, 96, 96) !important; background-color: rgb(239, 248, 206) !important; cursor: pointer !important; white-space: pre-wrap;">Legacy block comment.
 Second line.</div></body></html>"""  # noqa: E501
 
-        index_dir = os.path.join(self.test_input, '20200101000000000')
-        os.makedirs(index_dir, exist_ok=True)
-        with open(os.path.join(index_dir, 'index.html'), 'w', encoding='UTF-8') as fh:
-            fh.write(input)
-
-        for _info in wsb2sb.run(self.test_input, self.test_output):
-            pass
-
-        oid = util.datetime_to_id_legacy(util.id_to_datetime('20200101000000000'))
-        with open(os.path.join(self.test_output, 'data', oid, 'index.html'), encoding='UTF-8') as fh:
-            self.assertEqual(fh.read(), expected)
+        self.assertEqual(self.convert_index_file(input), expected)
 
     def test_convert_html_file_other(self):
         """Convert other elements."""
-        self.init_book(self.test_input, meta={
-            '20200101000000000': {
-                'index': '20200101000000000/index.html',
-                'type': '',
-            },
-        })
-
         input = """\
 <!DOCTYPE html>
 <html>
@@ -1124,28 +1025,11 @@ Donec nec lacus<span data-sb-obj="annotation">(my legacy <em>inline</em>annotati
 </html>
 """
 
-        index_dir = os.path.join(self.test_input, '20200101000000000')
-        os.makedirs(index_dir, exist_ok=True)
-        with open(os.path.join(index_dir, 'index.html'), 'w', encoding='UTF-8') as fh:
-            fh.write(input)
-
-        for _info in wsb2sb.run(self.test_input, self.test_output):
-            pass
-
-        oid = util.datetime_to_id_legacy(util.id_to_datetime('20200101000000000'))
-        with open(os.path.join(self.test_output, 'data', oid, 'index.html'), encoding='UTF-8') as fh:
-            self.assertEqual(fh.read(), expected)
+        self.assertEqual(self.convert_index_file(input), expected)
 
     def test_convert_html_file_skip_special_tags(self):
         """Do not rewrite content in <template>, <xml>, <math>, etc.
         """
-        self.init_book(self.test_input, meta={
-            '20200101000000000': {
-                'type': '',
-                'index': '20200101000000000/index.html',
-            },
-        })
-
         input = """\
 <!DOCTYPE html>
 <html>
@@ -1186,17 +1070,7 @@ Donec nec lacus<span data-sb-obj="annotation">(my legacy <em>inline</em>annotati
 </html>
 """
 
-        index_dir = os.path.join(self.test_input, '20200101000000000')
-        os.makedirs(index_dir, exist_ok=True)
-        with open(os.path.join(index_dir, 'index.html'), 'w', encoding='UTF-8') as fh:
-            fh.write(input)
-
-        for _info in wsb2sb.run(self.test_input, self.test_output):
-            pass
-
-        oid = util.datetime_to_id_legacy(util.id_to_datetime('20200101000000000'))
-        with open(os.path.join(self.test_output, 'data', oid, 'index.html'), encoding='UTF-8') as fh:
-            self.assertEqual(fh.read(), expected)
+        self.assertEqual(self.convert_index_file(input), expected)
 
 
 if __name__ == '__main__':
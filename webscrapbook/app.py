@@ -3,6 +3,7 @@
 import functools
 import json
 import os
+import stat
 import time
 import traceback
 import types
@@ -1525,26 +1526,21 @@ def file_info(file, base=None):
         statinfo = os.lstat(file)
     except OSError:
         # unexpected error when getting stat info
-        statinfo = None
-        size = None
-        last_modified = None
-    else:
-        size = statinfo.st_size
-        last_modified = statinfo.st_mtime
+        return FileInfo(name=name, type=None, size=None, last_modified=None)
 
-    if not os.path.lexists(file):
-        type = None
-    elif os.path.islink(file) or util.fs.isjunction(file):
+    # determine type from the lstat result to avoid extra stat calls
+    mode = statinfo.st_mode
+    if stat.S_ISLNK(mode):
         type = 'link'
-    elif os.path.isdir(file):
-        type = 'dir'
-    elif os.path.isfile(file):
+    elif stat.S_ISDIR(mode):
+        type = 'link' if util.fs.isjunction(file) else 'dir'
+    elif stat.S_ISREG(mode):
         type = 'file'
     else:
         type = 'unknown'
 
-    if type != 'file':
-        size = None
+    size = statinfo.st_size if type == 'file' else None
+    last_modified = statinfo.st_mtime
 
     return FileInfo(name=name, type=type, size=size, last_modified=last_modified)
 
@@ -35,12 +35,6 @@ class TreeFileMalformedJsonError(TreeFileMalformedError):
 class Book:
     """Main scrapbook book controller.
     """
-    # Escape U+2028 and U+2029 for embedded JSON data used as JavaScript code
-    # to prevent script breakage and potential security issue in old browsers
-    # not supporting ES2019, as they are not allowed in a string literal.
-    # https://stackoverflow.com/questions/16005091/node-js-javascript-stringify
-    JSON_TRANSLATER = str.maketrans({'\u2028': '\\u2028', '\u2029': '\\u2029'})
-
     REGEX_TREE_FILE_WRAPPER = re.compile(r'^(?:/\*.*\*/|[^(])+\(([\s\S]*)\)(?:/\*.*\*/|[\s;])*$')
     REGEX_ITEM_NOTE = re.compile(r'^.*?<pre>\n?([^<]*(?:<(?!/pre>)[^<]*)*)\n</pre>.*$', re.S)
 
@@ -172,9 +166,8 @@ class Book:
 
         # remove top-level None values to allow quick clear by appending file
         # e.g. add meta1.js with {'id1': None} to quickly delete 'id1' in meta.js
-        for k in tuple(data):
-            if data[k] is None:
-                del data[k]
+        for k in [k for k, v in data.items() if v is None]:
+            del data[k]
 
         return data
 
@@ -190,6 +183,20 @@ class Book:
         if refresh or self.fulltext is None:
             self.fulltext = self.load_tree_files('fulltext')
 
+    @staticmethod
+    def dump_tree_json(data, indent=2):
+        """Dump data as JSON code to embed in a tree file.
+        """
+        # Escape U+2028 and U+2029 for embedded JSON data used as JavaScript code
+        # to prevent script breakage and potential security issue in old browsers
+        # not supporting ES2019, as they are not allowed in a string literal.
+        # https://stackoverflow.com/questions/16005091/node-js-javascript-stringify
+        #
+        # Use str.replace rather than str.translate, which is much slower for
+        # a large string.
+        text = json.dumps(data, ensure_ascii=False, indent=indent)
+        return text.replace('\u2028', '\\u2028').replace('\u2029', '\\u2029')
+
     def save_tree_file(self, name, index, data):
         """Save a tree file.
 
@@ -205,7 +212,7 @@ class Book:
         self.save_tree_file('meta', i, f"""/**
  * Feel free to edit this file, but keep data code valid JSON format.
  */
-scrapbook.meta({json.dumps(data, ensure_ascii=False, indent=2).translate(self.JSON_TRANSLATER)})""")
+scrapbook.meta({self.dump_tree_json(data, indent=2)})""")
 
     def save_meta_files(self):
         """Save to tree/meta#.js
@@ -214,11 +221,11 @@ scrapbook.meta({json.dumps(data, ensure_ascii=False, indent=2).translate(self.JS
         i = 0
         size = 1
         meta = {}
-        for id in tuple(self.meta):
-            if self.meta[id] is None:
-                del self.meta[id]
-                continue
-            meta[id] = self.meta[id]
+        # remove None values first so that the dict can be iterated directly
+        for id in [id for id, val in self.meta.items() if val is None]:
+            del self.meta[id]
+        for id, val in self.meta.items():
+            meta[id] = val
             size += 1
             if size >= self.SAVE_META_THRESHOLD:
                 self.save_meta_file(i, meta)
@@ -244,7 +251,7 @@ scrapbook.meta({json.dumps(data, ensure_ascii=False, indent=2).translate(self.JS
         self.save_tree_file('toc', i, f"""/**
  * Feel free to edit this file, but keep data code valid JSON format.
  */
-scrapbook.toc({json.dumps(data, ensure_ascii=False, indent=2).translate(self.JSON_TRANSLATER)})""")
+scrapbook.toc({self.dump_tree_json(data, indent=2)})""")
 
     def save_toc_files(self):
         """Save to tree/toc#.js
@@ -253,12 +260,12 @@ scrapbook.toc({json.dumps(data, ensure_ascii=False, indent=2).translate(self.JSO
         i = 0
         size = 1
         toc = {}
-        for id in tuple(self.toc):
-            if self.toc[id] is None:
-                del self.toc[id]
-                continue
-            toc[id] = self.toc[id]
-            size += 1 + len(toc[id])
+        # remove None values first so that the dict can be iterated directly
+        for id in [id for id, val in self.toc.items() if val is None]:
+            del self.toc[id]
+        for id, val in self.toc.items():
+            toc[id] = val
+            size += 1 + len(val)
             if size >= self.SAVE_TOC_THRESHOLD:
                 self.save_toc_file(i, toc)
                 i += 1
@@ -283,7 +290,7 @@ scrapbook.toc({json.dumps(data, ensure_ascii=False, indent=2).translate(self.JSO
         self.save_tree_file('fulltext', i, f"""/**
  * This file is generated by WebScrapBook and is not intended to be edited.
  */
-scrapbook.fulltext({json.dumps(data, ensure_ascii=False, indent=1).translate(self.JSON_TRANSLATER)})""")
+scrapbook.fulltext({self.dump_tree_json(data, indent=1)})""")
 
     def save_fulltext_files(self):
         """Save to tree/fulltext#.js
@@ -292,13 +299,13 @@ scrapbook.fulltext({json.dumps(data, ensure_ascii=False, indent=1).translate(sel
         i = 0
         size = 1
         fulltext = {}
-        for id in tuple(self.fulltext):
-            if self.fulltext[id] is None:
-                del self.fulltext[id]
-                continue
-            fulltext[id] = self.fulltext[id]
-            for path in fulltext[id]:
-                size += len(fulltext[id][path]['content'])
+        # remove None values first so that the dict can be iterated directly
+        for id in [id for id, val in self.fulltext.items() if val is None]:
+            del self.fulltext[id]
+        for id, val in self.fulltext.items():
+            fulltext[id] = val
+            for entry in val.values():
+                size += len(entry['content'])
             if size >= self.SAVE_FULLTEXT_THRESHOLD:
                 self.save_fulltext_file(i, fulltext)
                 i += 1
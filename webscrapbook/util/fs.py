@@ -1214,13 +1214,14 @@ def zip_extract(zip, dst, subpath='', tzoffset=None):
 
             # extract entries and recover mtime
             zh.extractall(tempdir, entries)
+            if tzoffset is not None:
+                delta = datetime.now().astimezone().utcoffset().total_seconds()
             for entry in entries:
                 file = os.path.join(tempdir, entry)
                 zinfo = zh.getinfo(entry)
 
                 ts = zip_timestamp(zinfo)
                 if tzoffset is not None:
-                    delta = datetime.now().astimezone().utcoffset().total_seconds()
                     ts = ts - tzoffset + delta
                 os.utime(file, (ts, ts))
 